@@ -1,6 +1,26 @@
+import types
 import unittest
+from collections import namedtuple
 from unittest import mock  # for simulating payment failures
 
+TAX_RATE = 0.10      # Assume 10% tax rate.
+DELIVERY_FEE = 5.00  # Flat delivery fee.
+
+# Immutable results, so a cached instance can be handed out as-is.
+TotalInfo = namedtuple("TotalInfo", "subtotal tax delivery_fee total")
+CartLine = namedtuple("CartLine", "name quantity subtotal")
+
+# Shared read-only results for outcomes that carry no per-order data.
+_EMPTY_CART = types.MappingProxyType(
+    {"success": False, "message": "Cart is empty"})
+_ORDER_VALID = types.MappingProxyType(
+    {"success": True, "message": "Order is valid"})
+_VALIDATION_FAILED = types.MappingProxyType(
+    {"success": False, "message": "Order validation failed"})
+_PAYMENT_FAILED = types.MappingProxyType(
+    {"success": False, "message": "Payment failed"})
+
+
 # CartItem Class
 class CartItem:
     """
@@ -11,6 +31,8 @@ class CartItem:
         price (float): The item price.
         quantity (int): The quantity in the cart.
     """
+    __slots__ = ("name", "price", "quantity", "_subtotal")
+
     def __init__(self, name, price, quantity):
         """
         Initializes a CartItem.
@@ -23,24 +45,29 @@ class CartItem:
         self.name = name
         self.price = price
         self.quantity = quantity
+        self._subtotal = price * quantity
 
     def update_quantity(self, new_quantity):
         """
-        Updates the quantity of the item.
+        Updates the quantity of the item and its cached subtotal.
         
         Args:
             new_quantity (int): The new quantity.
         """
         self.quantity = new_quantity
+        self._subtotal = self.price * new_quantity
 
     def get_subtotal(self):
         """
-        Calculates the subtotal price for this item.
+        Returns the subtotal price for this item.
+        
+        The subtotal is computed when the quantity is set, so quantity 
+        changes must go through update_quantity().
         
         Returns:
             float: The subtotal price.
         """
-        return self.price * self.quantity
+        return self._subtotal
 
 
 # Cart Class
@@ -48,12 +75,30 @@ class Cart:
     """
     Represents a shopping cart containing CartItem objects.
     
+    Items should be changed through the Cart methods only, so that the
+    cached totals stay in sync.
+    
     Attributes:
-        items (list): List of CartItem objects.
+        items (list): List of CartItem objects, in insertion order.
     """
     def __init__(self):
         """Initializes an empty cart."""
-        self.items = []
+        self._items = {}  # Item name -> CartItem, insertion-ordered.
+        self._total_cache = None
+
+    def _invalidate_cache(self):
+        """Discards the cached totals after the cart changes."""
+        self._total_cache = None
+
+    @property
+    def items(self):
+        """
+        Returns the items in the cart.
+        
+        Returns:
+            list: List of CartItem objects, in insertion order.
+        """
+        return list(self._items.values())
 
     def add_item(self, name, price, quantity):
         """
@@ -67,12 +112,12 @@ class Cart:
         Returns:
             str: Message indicating update or addition.
         """
-        for item in self.items:
-            if item.name == name:
-                item.update_quantity(item.quantity + quantity)
-                return f"Updated {name} quantity to {item.quantity}"
-        new_item = CartItem(name, price, quantity)
-        self.items.append(new_item)
+        self._invalidate_cache()
+        item = self._items.get(name)
+        if item is not None:
+            item.update_quantity(item.quantity + quantity)
+            return f"Updated {name} quantity to {item.quantity}"
+        self._items[name] = CartItem(name, price, quantity)
         return f"Added {name} to cart"
 
     def remove_item(self, name):
@@ -85,7 +130,8 @@ class Cart:
         Returns:
             str: Message indicating removal.
         """
-        self.items = [item for item in self.items if item.name != name]
+        self._invalidate_cache()
+        self._items.pop(name, None)
         return f"Removed {name} from cart"
 
     def update_item_quantity(self, name, new_quantity):
@@ -99,36 +145,41 @@ class Cart:
         Returns:
             str: Message indicating update or not found.
         """
-        for item in self.items:
-            if item.name == name:
-                item.update_quantity(new_quantity)
-                return f"Updated {name} quantity to {new_quantity}"
-        return f"{name} not found in cart"
+        item = self._items.get(name)
+        if item is None:
+            return f"{name} not found in cart"
+        self._invalidate_cache()
+        item.update_quantity(new_quantity)
+        return f"Updated {name} quantity to {new_quantity}"
 
     def calculate_total(self):
         """
         Calculates the total cost of the items in the cart, including tax and 
         delivery fee.
         
+        The result is cached until the cart is next modified. Use 
+        `_asdict()` on it where a dict is needed.
+        
         Returns:
-            dict: Contains 'subtotal', 'tax', 'delivery_fee', and 'total'.
-        """
-        subtotal = sum(item.get_subtotal() for item in self.items)
-        tax = subtotal * 0.10  # Assume 10% tax rate.
-        delivery_fee = 5.00    # Flat delivery fee.
-        total = subtotal + tax + delivery_fee
-        return {"subtotal": subtotal, "tax": tax,
-                "delivery_fee": delivery_fee, "total": total}
+            TotalInfo: Fields 'subtotal', 'tax', 'delivery_fee', and 'total'.
+        """
+        if self._total_cache is None:
+            subtotal = sum(item.get_subtotal()
+                           for item in self._items.values())
+            tax = subtotal * TAX_RATE
+            total = subtotal + tax + DELIVERY_FEE
+            self._total_cache = TotalInfo(subtotal, tax, DELIVERY_FEE, total)
+        return self._total_cache
 
     def view_cart(self):
         """
         Provides a view of the items in the cart.
         
         Returns:
-            list: A list of dicts with item 'name', 'quantity', and 'subtotal'.
+            list: CartLine tuples with 'name', 'quantity', and 'subtotal'.
         """
-        return [{"name": item.name, "quantity": item.quantity,
-                 "subtotal": item.get_subtotal()} for item in self.items]
+        return [CartLine(item.name, item.quantity, item.get_subtotal())
+                for item in self._items.values()]
 
 
 # OrderPlacement Class
@@ -160,15 +211,17 @@ class OrderPlacement:
         items are available in the menu.
         
         Returns:
-            dict: Contains 'success' and 'message'.
-        """
-        if not self.cart.items:
-            return {"success": False, "message": "Cart is empty"}
-        for item in self.cart.items:
-            if not self.restaurant_menu.is_item_available(item.name):
-                return {"success": False,
-                        "message": f"{item.name} is not available"}
-        return {"success": True, "message": "Order is valid"}
+            Mapping: Contains 'success' and 'message'; read-only.
+        """
+        names = [item.name for item in self.cart.items]
+        if not names:
+            return _EMPTY_CART
+        missing = self.restaurant_menu.unavailable_items(names)
+        if missing:
+            # Report the first unavailable item in cart order.
+            name = next(name for name in names if name in missing)
+            return {"success": False, "message": f"{name} is not available"}
+        return _ORDER_VALID
 
     def proceed_to_checkout(self):
         """
@@ -191,18 +244,18 @@ class OrderPlacement:
             payment_method (PaymentMethod): The payment method to use.
         
         Returns:
-            dict: Contains 'success', 'message', and, if successful, an 
-            order ID and estimated delivery time.
+            Mapping: Contains 'success', 'message', and, if successful, an 
+            order ID and estimated delivery time. Failures are read-only.
         """
         if not self.validate_order()["success"]:
-            return {"success": False, "message": "Order validation failed"}
-        total = self.cart.calculate_total()["total"]
+            return _VALIDATION_FAILED
+        total = self.cart.calculate_total().total
         payment_success = payment_method.process_payment(total)
         if payment_success:
             return {"success": True, "message": "Order confirmed",
                     "order_id": "ORD123456", 
                     "estimated_delivery": "45 minutes"}
-        return {"success": False, "message": "Payment failed"}
+        return _PAYMENT_FAILED
 
 
 # PaymentMethod Class
@@ -231,6 +284,8 @@ class UserProfile:
     Attributes:
         delivery_address (str): The user's delivery address.
     """
+    __slots__ = ("delivery_address",)
+
     def __init__(self, delivery_address):
         """
         Initializes a UserProfile.
@@ -257,6 +312,7 @@ class RestaurantMenu:
             available_items (list): List of items.
         """
         self.available_items = available_items
+        self._available = frozenset(available_items)
 
     def is_item_available(self, item_name):
         """
@@ -268,7 +324,19 @@ class RestaurantMenu:
         Returns:
             bool: True if available, False otherwise.
         """
-        return item_name in self.available_items
+        return item_name in self._available
+
+    def unavailable_items(self, item_names):
+        """
+        Finds which of the given items are not on the menu.
+        
+        Args:
+            item_names (iterable): The item names to check.
+        
+        Returns:
+            set: The names that are not available.
+        """
+        return set(item_names).difference(self._available)
 
 
 # Unit tests for OrderPlacement class
@@ -295,12 +363,68 @@ class TestOrderPlacement(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertEqual(result["message"], "Pasta is not available")
 
+    def test_validate_order_reports_first_unavailable_item(self):
+        self.cart.add_item("Burger", 8.99, 1)
+        self.cart.add_item("Pasta", 15.99, 1)
+        self.cart.add_item("Soup", 6.99, 1)
+        result = self.order.validate_order()
+        self.assertFalse(result["success"])
+        self.assertEqual(result["message"], "Pasta is not available")
+
     def test_validate_order_success(self):
         self.cart.add_item("Burger", 8.99, 2)
         result = self.order.validate_order()
         self.assertTrue(result["success"])
         self.assertEqual(result["message"], "Order is valid")
 
+    def test_cart_add_update_remove(self):
+        self.cart.add_item("Burger", 8.99, 1)
+        self.cart.add_item("Pizza", 12.99, 1)
+        self.assertEqual(self.cart.add_item("Burger", 8.99, 2),
+                         "Updated Burger quantity to 3")
+        self.assertEqual([item.name for item in self.cart.items],
+                         ["Burger", "Pizza"])
+        self.assertEqual(self.cart.update_item_quantity("Salad", 1),
+                         "Salad not found in cart")
+        self.cart.remove_item("Burger")
+        self.assertEqual([item.name for item in self.cart.items], ["Pizza"])
+
+    def test_calculate_total_tracks_cart_changes(self):
+        self.cart.add_item("Burger", 10.00, 1)
+        self.assertAlmostEqual(self.cart.calculate_total().subtotal, 10.00)
+        self.cart.add_item("Burger", 10.00, 1)
+        self.assertAlmostEqual(self.cart.calculate_total().subtotal, 20.00)
+        self.cart.update_item_quantity("Burger", 3)
+        self.assertAlmostEqual(self.cart.calculate_total().total, 38.00)
+        self.cart.remove_item("Burger")
+        self.assertAlmostEqual(self.cart.calculate_total().total, 5.00)
+
+    def test_calculate_total_fractional_and_integer_amounts(self):
+        for i in range(40):
+            self.cart.add_item(f"Item {i}", 1.00, 1.5)
+        self.assertAlmostEqual(self.cart.calculate_total().subtotal, 60.00)
+        cart = Cart()
+        for i in range(40):
+            cart.add_item(f"Item {i}", 2, 1)
+        subtotal = cart.calculate_total().subtotal
+        self.assertEqual(subtotal, 80)
+        self.assertIsInstance(subtotal, int)
+
+    def test_cart_item_subtotal_follows_quantity(self):
+        item = CartItem("Burger", 2.50, 2)
+        self.assertAlmostEqual(item.get_subtotal(), 5.00)
+        item.update_quantity(4)
+        self.assertAlmostEqual(item.get_subtotal(), 10.00)
+
+    def test_proceed_to_checkout(self):
+        self.cart.add_item("Burger", 10.00, 2)
+        order_data = self.order.proceed_to_checkout()
+        self.assertEqual(order_data["items"], [CartLine("Burger", 2, 20.00)])
+        self.assertEqual(order_data["total_info"]._asdict(),
+                         {"subtotal": 20.00, "tax": 2.00,
+                          "delivery_fee": 5.00, "total": 27.00})
+        self.assertEqual(order_data["delivery_address"], "123 Main St")
+
     def test_confirm_order_success(self):
         self.cart.add_item("Pizza", 12.99, 1)
         payment_method = PaymentMethod()
@@ -309,6 +433,12 @@ class TestOrderPlacement(unittest.TestCase):
         self.assertEqual(result["message"], "Order confirmed")
         self.assertEqual(result["order_id"], "ORD123456")
 
+    def test_validate_order_result_is_read_only(self):
+        result = self.order.validate_order()
+        with self.assertRaises(TypeError):
+            result["success"] = True
+        self.assertFalse(self.order.validate_order()["success"])
+
     def test_confirm_order_failed_payment(self):
         self.cart.add_item("Pizza", 12.99, 1)
         payment_method = PaymentMethod()
@@ -1,6 +1,11 @@
+import re
 import unittest
 from unittest import mock  # for simulating payment gateway responses
 
+# Compiled once at import; ASCII digits only, exact lengths.
+_CARD_NUMBER_RE = re.compile(r"[0-9]{16}")
+_CVV_RE = re.compile(r"[0-9]{3}")
+
 
 class PaymentProcessing:
     """
@@ -8,7 +13,7 @@ class PaymentProcessing:
     payment methods.
 
     Attributes:
-        available_gateways (list): Supported payment gateways, e.g.
+        available_gateways (frozenset): Supported payment gateways, e.g.
             "credit_card" and "paypal".
     """
 
@@ -16,7 +21,7 @@ class PaymentProcessing:
         """
         Initializes PaymentProcessing with available payment gateways.
         """
-        self.available_gateways = ["credit_card", "paypal"]
+        self.available_gateways = frozenset(("credit_card", "paypal"))
 
     def validate_payment_method(self, payment_method, payment_details):
         """
@@ -35,17 +40,35 @@ class PaymentProcessing:
             ValueError: If the payment method is unsupported or details are 
                 invalid.
         """
+        ok, error = self.check_payment_method(payment_method, payment_details)
+        if not ok:
+            raise ValueError(error)
+        return True
+
+    def check_payment_method(self, payment_method, payment_details):
+        """
+        Checks the payment method and its details without raising.
+
+        Args:
+            payment_method (str): The selected payment method.
+            payment_details (dict): Details required for the payment method.
+
+        Returns:
+            tuple: (True, None) if valid, otherwise (False, error message).
+        """
         if payment_method not in self.available_gateways:
-            raise ValueError("Invalid payment method")
+            return False, "Invalid payment method"
         if payment_method == "credit_card":
             if not self.validate_credit_card(payment_details):
-                raise ValueError("Invalid credit card details")
-        return True
+                return False, "Invalid credit card details"
+        return True, None
 
     def validate_credit_card(self, details):
         """
         Validates credit card details.
 
+        The card number must be exactly 16 digits and the CVV exactly 3.
+
         Args:
             details (dict): Contains "card_number", "expiry_date", and "cvv".
 
@@ -55,9 +78,8 @@ class PaymentProcessing:
         card_number = details.get("card_number", "")
         expiry_date = details.get("expiry_date", "")
         cvv = details.get("cvv", "")
-        if len(card_number) != 16 or len(cvv) != 3:
-            return False
-        return True
+        return bool(_CARD_NUMBER_RE.fullmatch(card_number)
+                    and _CVV_RE.fullmatch(cvv))
 
     def process_payment(self, order, payment_method, payment_details):
         """
@@ -72,8 +94,10 @@ class PaymentProcessing:
         Returns:
             str: Message indicating success or failure.
         """
+        ok, error = self.check_payment_method(payment_method, payment_details)
+        if not ok:
+            return f"Error: {error}"
         try:
-            self.validate_payment_method(payment_method, payment_details)
             payment_response = self.mock_payment_gateway(
                 payment_method, payment_details, order["total_amount"]
             )
@@ -84,6 +108,22 @@ class PaymentProcessing:
         except Exception as e:
             return f"Error: {str(e)}"
 
+    def process_payment_batch(self, payments):
+        """
+        Processes a batch of payments, e.g. for end-of-day reconciliation.
+
+        Args:
+            payments (list): (order, payment_method, payment_details) tuples.
+
+        Returns:
+            list: One message per payment, in order, as from
+            `process_payment()`.
+        """
+        return [
+            self.process_payment(order, payment_method, payment_details)
+            for order, payment_method, payment_details in payments
+        ]
+
     def mock_payment_gateway(self, method, details, amount):
         """
         Simulates interaction with a payment gateway.
@@ -149,6 +189,22 @@ class TestPaymentProcessing(unittest.TestCase):
         result = self.payment_processing.validate_credit_card(payment_details)
         self.assertFalse(result)
 
+    def test_validate_credit_card_non_digit_details(self):
+        """
+        Test failure due to non-digit card number or CVV of the right length.
+        """
+        payment_details = {
+            "card_number": "1234-5678-1234-5",
+            "expiry_date": "12/25",
+            "cvv": "123",
+        }
+        self.assertFalse(
+            self.payment_processing.validate_credit_card(payment_details))
+        payment_details["card_number"] = "1234567812345678"
+        payment_details["cvv"] = "12a"
+        self.assertFalse(
+            self.payment_processing.validate_credit_card(payment_details))
+
     def test_process_payment_success(self):
         """
         Test successful payment processing with valid details.
@@ -202,6 +258,44 @@ class TestPaymentProcessing(unittest.TestCase):
         )
         self.assertIn("Error: Invalid payment method", result)
 
+    def test_process_payment_batch(self):
+        """
+        Test that a batch returns one message per payment, in order.
+        """
+        card = {
+            "card_number": "1234567812345678",
+            "expiry_date": "12/25",
+            "cvv": "123",
+        }
+        declined = dict(card, card_number="1111222233334444")
+        results = self.payment_processing.process_payment_batch([
+            ({"total_amount": 10.00}, "credit_card", card),
+            ({"total_amount": 20.00}, "bitcoin", card),
+            ({"total_amount": 30.00}, "credit_card", declined),
+        ])
+        self.assertEqual(results, [
+            "Payment successful, Order confirmed",
+            "Error: Invalid payment method",
+            "Payment failed, please try again",
+        ])
+
+    def test_process_payment_invalid_card_does_not_raise(self):
+        """
+        Test that invalid card details are reported without an exception.
+        """
+        order = {"total_amount": 100.00}
+        payment_details = {"card_number": "1234", "expiry_date": "12/25",
+                           "cvv": "123"}
+        ok, error = self.payment_processing.check_payment_method(
+            "credit_card", payment_details
+        )
+        self.assertFalse(ok)
+        self.assertEqual(error, "Invalid credit card details")
+        result = self.payment_processing.process_payment(
+            order, "credit_card", payment_details
+        )
+        self.assertEqual(result, "Error: Invalid credit card details")
+
 
 if __name__ == "__main__":
     unittest.main()
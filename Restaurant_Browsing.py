@@ -2,7 +2,9 @@
 Module for restaurant browsing and database simulation.
 """
 
+import bisect
 import unittest  # Module-level imports must be at the top
+from collections import defaultdict
 
 
 class RestaurantBrowsing:
@@ -33,11 +35,7 @@ class RestaurantBrowsing:
         Returns:
             list: Restaurants that match the cuisine type.
         """
-        return [
-            restaurant
-            for restaurant in self.database.get_restaurants()
-            if restaurant["cuisine"].lower() == cuisine_type.lower()
-        ]
+        return list(self.database.get_by_cuisine(cuisine_type))
 
     def search_by_location(self, location):
         """
@@ -49,11 +47,7 @@ class RestaurantBrowsing:
         Returns:
             list: Restaurants in the specified location.
         """
-        return [
-            restaurant
-            for restaurant in self.database.get_restaurants()
-            if restaurant["location"].lower() == location.lower()
-        ]
+        return list(self.database.get_by_location(location))
 
     def search_by_rating(self, min_rating):
         """
@@ -65,11 +59,7 @@ class RestaurantBrowsing:
         Returns:
             list: Restaurants with rating >= min_rating.
         """
-        return [
-            restaurant
-            for restaurant in self.database.get_restaurants()
-            if restaurant["rating"] >= min_rating
-        ]
+        return self.database.get_by_min_rating(min_rating)
 
     def search_by_filters(self, cuisine_type=None, location=None,
                           min_rating=None):
@@ -82,28 +72,29 @@ class RestaurantBrowsing:
             min_rating (float, optional): The minimum rating.
 
         Returns:
-            list: Restaurants matching all filters.
+            list: Restaurants matching all filters, in database order.
         """
-        results = self.database.get_restaurants()
-        if cuisine_type:
-            results = [
-                restaurant
-                for restaurant in results
-                if restaurant["cuisine"].lower() == cuisine_type.lower()
-            ]
-        if location:
-            results = [
-                restaurant
-                for restaurant in results
-                if restaurant["location"].lower() == location.lower()
-            ]
-        if min_rating:
-            results = [
-                restaurant
-                for restaurant in results
-                if restaurant["rating"] >= min_rating
-            ]
-        return results
+        # Cuisine and location are answered by the database's indexes,
+        # leaving only the rating to check row by row; a rating-only
+        # search uses the rating index instead.
+        if cuisine_type and location:
+            results = self.database.get_by_cuisine_and_location(
+                cuisine_type, location)
+        elif cuisine_type:
+            results = self.database.get_by_cuisine(cuisine_type)
+        elif location:
+            results = self.database.get_by_location(location)
+        elif min_rating:
+            return self.database.get_by_min_rating(min_rating)
+        else:
+            results = self.database.get_restaurants()
+        if not min_rating:
+            return list(results)
+        return [
+            restaurant
+            for restaurant in results
+            if restaurant["rating"] >= min_rating
+        ]
 
 
 class RestaurantDatabase:
@@ -160,6 +151,24 @@ class RestaurantDatabase:
                 "delivery": True,
             },
         ]
+        # Indexes keyed by lowercased values, normalized once here so
+        # searches never lowercase the stored data.
+        self._by_cuisine = defaultdict(list)
+        self._by_location = defaultdict(list)
+        self._by_cuisine_location = defaultdict(list)
+        for restaurant in self.restaurants:
+            cuisine = restaurant["cuisine"].lower()
+            location = restaurant["location"].lower()
+            self._by_cuisine[cuisine].append(restaurant)
+            self._by_location[location].append(restaurant)
+            self._by_cuisine_location[cuisine, location].append(restaurant)
+        # Positions in `restaurants` sorted by rating, with the ratings
+        # alongside so bisect can find a cutoff.
+        self._rating_order = sorted(
+            range(len(self.restaurants)),
+            key=lambda position: self.restaurants[position]["rating"])
+        self._ratings = [self.restaurants[position]["rating"]
+                         for position in self._rating_order]
 
     def get_restaurants(self):
         """
@@ -170,6 +179,59 @@ class RestaurantDatabase:
         """
         return self.restaurants
 
+    def get_by_cuisine(self, cuisine):
+        """
+        Retrieve restaurants serving a cuisine, ignoring case.
+
+        Args:
+            cuisine (str): The type of cuisine (e.g., "Italian").
+
+        Returns:
+            list: Matching restaurant dictionaries; do not modify.
+        """
+        return self._by_cuisine.get(cuisine.lower(), [])
+
+    def get_by_location(self, location):
+        """
+        Retrieve restaurants in a location, ignoring case.
+
+        Args:
+            location (str): The location (e.g., "Downtown").
+
+        Returns:
+            list: Matching restaurant dictionaries; do not modify.
+        """
+        return self._by_location.get(location.lower(), [])
+
+    def get_by_min_rating(self, min_rating):
+        """
+        Retrieve restaurants rated at least `min_rating`.
+
+        Args:
+            min_rating (float): The minimum rating (e.g., 4.0).
+
+        Returns:
+            list: A new list of matching restaurant dictionaries, in
+            database order.
+        """
+        cutoff = bisect.bisect_left(self._ratings, min_rating)
+        return [self.restaurants[position]
+                for position in sorted(self._rating_order[cutoff:])]
+
+    def get_by_cuisine_and_location(self, cuisine, location):
+        """
+        Retrieve restaurants serving a cuisine in a location, ignoring case.
+
+        Args:
+            cuisine (str): The type of cuisine (e.g., "Italian").
+            location (str): The location (e.g., "Downtown").
+
+        Returns:
+            list: Matching restaurant dictionaries; do not modify.
+        """
+        return self._by_cuisine_location.get(
+            (cuisine.lower(), location.lower()), [])
+
 
 class RestaurantSearch:
     """
@@ -257,6 +319,37 @@ class TestRestaurantBrowsing(unittest.TestCase):
             )
         )
 
+    def test_search_by_rating_order_and_bounds(self):
+        """
+        Test that rating search keeps database order and the cutoff.
+        """
+        results = self.browsing.search_by_rating(4.2)
+        self.assertEqual(
+            [restaurant["name"] for restaurant in results],
+            ["Italian Bistro", "Sushi House", "Taco Town"],
+        )
+        self.assertEqual(self.browsing.search_by_rating(5.0), [])
+        self.assertEqual(self.browsing.search_by_rating(0.0),
+                         self.database.get_restaurants())
+
+    def test_search_by_filters_order_is_consistent(self):
+        """
+        Test that results are in database order whichever filters are set.
+        """
+        rating_only = self.browsing.search_by_filters(min_rating=4.0)
+        self.assertEqual(
+            [restaurant["name"] for restaurant in rating_only],
+            ["Italian Bistro", "Sushi House", "Burger King", "Taco Town"],
+        )
+        with_location = self.browsing.search_by_filters(
+            location="Downtown", min_rating=4.0
+        )
+        self.assertEqual(
+            with_location,
+            [restaurant for restaurant in rating_only
+             if restaurant["location"] == "Downtown"],
+        )
+
     def test_search_by_filters(self):
         """
         Test searching by multiple filters.
@@ -267,6 +360,18 @@ class TestRestaurantBrowsing(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]["name"], "Italian Bistro")
 
+    def test_search_is_case_insensitive(self):
+        """
+        Test that indexed searches ignore case and miss cleanly.
+        """
+        self.assertEqual(len(self.browsing.search_by_cuisine("iTaLiAn")), 2)
+        self.assertEqual(len(self.browsing.search_by_location("UPTOWN")), 2)
+        self.assertEqual(self.browsing.search_by_cuisine("Thai"), [])
+        results = self.browsing.search_by_filters(
+            cuisine_type="italian", location="uptown"
+        )
+        self.assertEqual([r["name"] for r in results], ["Pizza Palace"])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,13 +2,61 @@
 Module for user registration functionality.
 """
 
+import hashlib
+import hmac
+import os
+import re
+import types
+import unittest
+
+# Compiled once at import; matches "local@domain.tld" with no whitespace
+# and exactly one "@".
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+# ASCII only. Unicode classes do not line up with str.isalpha() and
+# str.isdigit(); e.g. [^\W\d_] also matches "²", "½" and "Ⅻ".
+_HAS_DIGIT_RE = re.compile(r"[0-9]")
+_HAS_LETTER_RE = re.compile(r"[A-Za-z]")
+
+_PBKDF2_ITERATIONS = 100_000
+
+# Shared read-only results; register() returns these rather than
+# building a new dict for each outcome.
+_INVALID_EMAIL = types.MappingProxyType(
+    {"success": False, "error": "Invalid email format"})
+_PASSWORD_MISMATCH = types.MappingProxyType(
+    {"success": False, "error": "Passwords do not match"})
+_WEAK_PASSWORD = types.MappingProxyType(
+    {"success": False, "error": "Password is not strong enough"})
+_ALREADY_REGISTERED = types.MappingProxyType(
+    {"success": False, "error": "Email already registered"})
+_REGISTERED = types.MappingProxyType(
+    {"success": True,
+     "message": "Registration successful, confirmation email sent"})
+
+
+def _hash_password(password, salt):
+    """
+    Derive a PBKDF2-SHA256 hash of a password.
+
+    Args:
+        password (str): The plaintext password.
+        salt (bytes): A per-user random salt.
+
+    Returns:
+        str: The derived hash, hex-encoded so it can be stored as JSON.
+    """
+    return hashlib.pbkdf2_hmac(
+        "sha256", password.encode(), salt, _PBKDF2_ITERATIONS
+    ).hex()
+
 
 class UserRegistration:
     """
     A user registration system to store user data.
 
-    The `users` dict maps an email to a dict containing the user's
-    password and confirmation status.
+    The `users` dict maps a normalized (stripped, lowercase) email to a
+    dict containing the user's salted password hash and confirmation
+    status. Plaintext passwords are never stored.
     """
 
     def __init__(self):
@@ -25,8 +73,10 @@ class UserRegistration:
          - Password strength
          - Email not already registered
 
-        On success, stores user with `confirmed=False` and returns a
-        success message.
+        The email is stripped and lowercased first, so addresses that
+        differ only in case or surrounding whitespace are the same user.
+        On success, stores the user's password hash with
+        `confirmed=False` and returns a success message.
 
         Args:
             email (str): The user's email.
@@ -34,30 +84,175 @@ class UserRegistration:
             confirm_password (str): Confirmation password.
 
         Returns:
-            dict:
+            Mapping (read-only):
                 - Success: {"success": True, "message": "..."}
                 - Failure: {"success": False, "error": "..."}
         """
+        email = self.normalize_email(email)
+        error = self._check_credentials(email, password, confirm_password)
+        if error is not None:
+            return error
+        if email in self.users:
+            return _ALREADY_REGISTERED
+        self.users[email] = self._new_user(password)
+        return _REGISTERED
+
+    def register_many(self, rows):
+        """
+        Register a batch of users in one call.
+
+        Each row is checked exactly as by `register()`, including
+        against rows earlier in the same batch, and all accepted users
+        are added to `users` with a single update at the end.
+
+        Args:
+            rows (list): (email, password, confirm_password) tuples.
+
+        Returns:
+            list: One result mapping per row, in order, as from
+            `register()`.
+        """
+        new_users = {}
+        results = []
+        for email, password, confirm_password in rows:
+            email = self.normalize_email(email)
+            error = self._check_credentials(
+                email, password, confirm_password)
+            if error is None and (email in self.users or email in new_users):
+                error = _ALREADY_REGISTERED
+            if error is not None:
+                results.append(error)
+                continue
+            new_users[email] = self._new_user(password)
+            results.append(_REGISTERED)
+        self.users.update(new_users)
+        return results
+
+    def _check_credentials(self, email, password, confirm_password):
+        """
+        Check the email format and password for a registration.
+
+        Args:
+            email (str): The normalized email.
+            password (str): The user's password.
+            confirm_password (str): Confirmation password.
+
+        Returns:
+            Mapping: The failure result, or None if all checks pass.
+        """
         if not self.is_valid_email(email):
-            return {"success": False, "error": "Invalid email format"}
+            return _INVALID_EMAIL
         if password != confirm_password:
-            return {"success": False, "error": "Passwords do not match"}
+            return _PASSWORD_MISMATCH
         if not self.is_strong_password(password):
-            return {"success": False, "error": "Password is not strong enough"}
-        if email in self.users:
-            return {"success": False, "error": "Email already registered"}
+            return _WEAK_PASSWORD
+        return None
+
+    def _new_user(self, password):
+        """
+        Build the stored record for a newly registered user.
 
-        self.users[email] = {"password": password, "confirmed": False}
+        Args:
+            password (str): The user's password.
+
+        Returns:
+            dict: The salted password hash and `confirmed=False`.
+        """
+        salt = os.urandom(16)
         return {
-            "success": True,
-            "message": "Registration successful, confirmation email sent"
+            "password_hash": _hash_password(password, salt),
+            "salt": salt.hex(),
+            "confirmed": False,
         }
 
+    def authenticate(self, email, password):
+        """
+        Check a login attempt against the stored password hash.
+
+        Args:
+            email (str): The user's email, normalized before lookup.
+            password (str): The password to verify.
+
+        Returns:
+            bool: True if the user exists and the password matches.
+        """
+        email = self.normalize_email(email)
+        user = self.users.get(email)
+        if user is None:
+            return False
+        if "password_hash" not in user:
+            # Legacy plaintext record; upgrade it on a successful login.
+            if "password" not in user or not hmac.compare_digest(
+                    user["password"].encode(), password.encode()):
+                return False
+            self.users[email] = self._upgrade_user(user)
+            return True
+        password_hash = _hash_password(password, bytes.fromhex(user["salt"]))
+        return hmac.compare_digest(password_hash, user["password_hash"])
+
+    def import_users(self, users):
+        """
+        Replace `users` with previously saved records, upgrading them.
+
+        Records saved by older versions were keyed by the raw email and
+        held a plaintext "password". Keys are normalized, and plaintext
+        passwords are replaced by a salted hash. If several saved keys
+        normalize to the same email, the one already in normalized form
+        wins; otherwise the first one seen is kept.
+
+        Args:
+            users (dict): Saved users, e.g. as read from users.json.
+
+        Returns:
+            bool: True if any record was changed and should be re-saved.
+        """
+        changed = False
+        self.users = {}
+        for email, user in users.items():
+            key = self.normalize_email(email)
+            if key != email:
+                changed = True
+                if key in self.users:
+                    continue
+            if "password_hash" not in user and "password" in user:
+                user = self._upgrade_user(user)
+                changed = True
+            self.users[key] = user
+        return changed
+
+    def _upgrade_user(self, user):
+        """
+        Convert a legacy plaintext record to the hashed format.
+
+        Args:
+            user (dict): A record holding a plaintext "password".
+
+        Returns:
+            dict: A new record with a salted password hash, keeping the
+            original confirmation status.
+        """
+        upgraded = self._new_user(user["password"])
+        upgraded["confirmed"] = user.get("confirmed", False)
+        return upgraded
+
+    def normalize_email(self, email):
+        """
+        Normalize an email for use as a `users` key.
+
+        Args:
+            email (str): The email address.
+
+        Returns:
+            str: The email with surrounding whitespace removed, lowercased.
+        """
+        return email.strip().lower()
+
     def is_valid_email(self, email):
         """
         Check if the provided email is valid.
 
-        A valid email has an '@' symbol and a '.' in the domain part.
+        A valid email has a single '@' symbol, no whitespace, and a '.'
+        in the domain part with text on both sides of it.
 
         Args:
             email (str): The email address.
@@ -65,14 +260,15 @@ class UserRegistration:
         Returns:
             bool: True if valid, else False.
         """
-        return "@" in email and "." in email.split("@")[-1]
+        return _EMAIL_RE.fullmatch(email) is not None
 
     def is_strong_password(self, password):
         """
         Check if the password meets strength requirements.
 
         A strong password is at least 8 characters long and has at
-        least one letter and one digit.
+        least one ASCII letter (A-Z, a-z) and one ASCII digit (0-9).
+        Other characters are allowed but do not count towards either.
 
         Args:
             password (str): The password to check.
@@ -82,6 +278,201 @@ class UserRegistration:
         """
         return (
             len(password) >= 8
-            and any(c.isdigit() for c in password)
-            and any(c.isalpha() for c in password)
+            and _HAS_DIGIT_RE.search(password) is not None
+            and _HAS_LETTER_RE.search(password) is not None
         )
+
+
+class TestUserRegistration(unittest.TestCase):
+    """
+    Unit tests for UserRegistration.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh registration system.
+        """
+        self.registration = UserRegistration()
+
+    def test_register_success(self):
+        """
+        Test that a valid registration is stored unconfirmed.
+        """
+        result = self.registration.register(
+            "alice@example.com", "secret123", "secret123"
+        )
+        self.assertTrue(result["success"])
+        self.assertFalse(self.registration.users["alice@example.com"]
+                         ["confirmed"])
+
+    def test_register_normalizes_email(self):
+        """
+        Test that case and whitespace variants are the same user.
+        """
+        self.registration.register(
+            " Alice@Example.COM ", "secret123", "secret123"
+        )
+        result = self.registration.register(
+            "alice@example.com", "secret123", "secret123"
+        )
+        self.assertFalse(result["success"])
+        self.assertEqual(result["error"], "Email already registered")
+        self.assertEqual(list(self.registration.users), ["alice@example.com"])
+
+    def test_register_does_not_store_plaintext(self):
+        """
+        Test that only a salted hash of the password is stored.
+        """
+        self.registration.register("a@example.com", "secret123", "secret123")
+        self.registration.register("b@example.com", "secret123", "secret123")
+        first = self.registration.users["a@example.com"]
+        second = self.registration.users["b@example.com"]
+        self.assertNotIn("password", first)
+        self.assertNotIn("secret123", first.values())
+        self.assertNotEqual(first["salt"], second["salt"])
+        self.assertNotEqual(first["password_hash"], second["password_hash"])
+
+    def test_authenticate(self):
+        """
+        Test login with right and wrong passwords and unknown users.
+        """
+        self.registration.register(
+            "alice@example.com", "secret123", "secret123"
+        )
+        self.assertTrue(
+            self.registration.authenticate(" ALICE@example.com", "secret123"))
+        self.assertFalse(
+            self.registration.authenticate("alice@example.com", "secret124"))
+        self.assertFalse(
+            self.registration.authenticate("bob@example.com", "secret123"))
+
+    def test_is_valid_email(self):
+        """
+        Test the email format check, including the stricter cases.
+        """
+        for email in ("a@b.co", "first.last@mail.example.com"):
+            self.assertTrue(self.registration.is_valid_email(email), email)
+        for email in ("a b@c.co", "a@b c.co", "a@@b.co", "a@b@c.co",
+                      "a@b.co\n", "@b.co", "a@.co", "a@b.", "a@bco"):
+            self.assertFalse(self.registration.is_valid_email(email), email)
+
+    def test_is_strong_password(self):
+        """
+        Test the password strength check, which counts only ASCII
+        letters and digits.
+        """
+        for password in ("secret123", "1234567a", "пароль12a", "ß1234567Z"):
+            self.assertTrue(
+                self.registration.is_strong_password(password), password)
+        for password in ("secr3t", "12345678", "abcdefgh",
+                         "________1", "1234567_",
+                         "1234567²", "12345678½", "1234567Ⅻ", "abcdefg²",
+                         "пароль12", "ßßßßßßß9"):
+            self.assertFalse(
+                self.registration.is_strong_password(password), password)
+
+    def test_register_many(self):
+        """
+        Test batch registration against existing and in-batch users.
+        """
+        self.registration.register("old@b.co", "secret123", "secret123")
+        results = self.registration.register_many([
+            ("a@b.co", "secret123", "secret123"),
+            ("bad-email", "secret123", "secret123"),
+            ("A@B.co", "secret123", "secret123"),
+            (" OLD@b.co", "secret123", "secret123"),
+            ("c@b.co", "secret123", "secret124"),
+            ("d@b.co", "secret123", "secret123"),
+        ])
+        self.assertEqual(
+            [result.get("error") for result in results],
+            [None, "Invalid email format", "Email already registered",
+             "Email already registered", "Passwords do not match", None],
+        )
+        self.assertTrue(results[0]["success"])
+        self.assertEqual(list(self.registration.users),
+                         ["old@b.co", "a@b.co", "d@b.co"])
+        self.assertTrue(self.registration.authenticate("d@b.co", "secret123"))
+
+    def test_register_many_updates_users_once(self):
+        """
+        Test that accepted rows reach `users` in a single update.
+        """
+        writes = []
+
+        class RecordingDict(dict):
+            def __setitem__(self, key, value):
+                writes.append(("setitem", key))
+                super().__setitem__(key, value)
+
+            def update(self, other):
+                writes.append(("update", sorted(other)))
+                super().update(other)
+
+        self.registration.users = RecordingDict()
+        self.registration.register_many([
+            ("a@b.co", "secret123", "secret123"),
+            ("b@b.co", "secret123", "secret123"),
+        ])
+        self.assertEqual(writes, [("update", ["a@b.co", "b@b.co"])])
+
+    def test_import_users_upgrades_legacy_records(self):
+        """
+        Test that saved plaintext records are normalized and hashed.
+        """
+        changed = self.registration.import_users({
+            "Bob@Y.com": {"password": "secret123", "confirmed": True},
+        })
+        self.assertTrue(changed)
+        self.assertEqual(list(self.registration.users), ["bob@y.com"])
+        user = self.registration.users["bob@y.com"]
+        self.assertNotIn("password", user)
+        self.assertTrue(user["confirmed"])
+        self.assertTrue(
+            self.registration.authenticate("Bob@Y.com", "secret123"))
+        result = self.registration.register(
+            "Bob@Y.com", "secret123", "secret123"
+        )
+        self.assertEqual(result["error"], "Email already registered")
+
+    def test_import_users_prefers_normalized_key(self):
+        """
+        Test that a normalized record wins over a legacy duplicate.
+        """
+        current = UserRegistration()
+        current.register("bob@y.com", "newpass123", "newpass123")
+        self.registration.import_users({
+            "Bob@Y.com": {"password": "oldpass123", "confirmed": False},
+            "bob@y.com": current.users["bob@y.com"],
+        })
+        self.assertEqual(list(self.registration.users), ["bob@y.com"])
+        self.assertTrue(
+            self.registration.authenticate("bob@y.com", "newpass123"))
+
+    def test_import_users_unchanged(self):
+        """
+        Test that already-current records are reported as unchanged.
+        """
+        self.registration.register("a@example.com", "secret123", "secret123")
+        saved = dict(self.registration.users)
+        self.assertFalse(UserRegistration().import_users(saved))
+
+    def test_authenticate_upgrades_legacy_record(self):
+        """
+        Test the plaintext fallback and re-hash on a successful login.
+        """
+        self.registration.users = {
+            "bob@y.com": {"password": "secret123", "confirmed": False},
+        }
+        self.assertFalse(
+            self.registration.authenticate("bob@y.com", "wrongpass1"))
+        self.assertIn("password", self.registration.users["bob@y.com"])
+        self.assertTrue(
+            self.registration.authenticate("bob@y.com", "secret123"))
+        self.assertNotIn("password", self.registration.users["bob@y.com"])
+        self.assertTrue(
+            self.registration.authenticate("bob@y.com", "secret123"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -37,12 +37,10 @@ class Application(tk.Tk):
         self.title("Mobile Food Delivery App")
         self.geometry("600x400")
 
-        # Load user data
-        self.user_data = load_users()
-
-        # Initialize core classes
+        # Initialize core classes, upgrading any legacy user records
         self.registration = UserRegistration()
-        self.registration.users = self.user_data
+        if self.registration.import_users(load_users()):
+            save_users(self.registration.users)
 
         self.database = RestaurantDatabase()
         self.browsing = RestaurantBrowsing(self.database)
@@ -193,13 +191,9 @@ class LoginFrame(tk.Frame):
     def login(self):
         email = self.email_entry.get()
         password = self.pass_entry.get()
-        users = self.master.registration.users
-        valid_login = (
-            email in users and
-            users[email]["password"] == password
-        )
-        if valid_login:
-            self.master.login_user(email)
+        registration = self.master.registration
+        if registration.authenticate(email, password):
+            self.master.login_user(registration.normalize_email(email))
         else:
             messagebox.showerror("Error", "Invalid\nlogin")
 
@@ -378,8 +372,8 @@ class CartViewPopup(tk.Toplevel):
                 tk.Label(
                     self,
                     text=(
-                        f"{i['name']} x{i['quantity']} = "
-                        f"${i['subtotal']:.2f}"
+                        f"{i.name} x{i.quantity} = "
+                        f"${i.subtotal:.2f}"
                     ),
                 ).pack()
 
@@ -401,27 +395,27 @@ class CheckoutPopup(tk.Toplevel):
             tk.Label(
                 self,
                 text=(
-                    f"{item['name']} x{item['quantity']} = "
-                    f"${item['subtotal']:.2f}"
+                    f"{item.name} x{item.quantity} = "
+                    f"${item.subtotal:.2f}"
                 ),
             ).pack()
 
         total = order_data["total_info"]
         tk.Label(
             self,
-            text=f"Subtotal: ${total['subtotal']:.2f}"
+            text=f"Subtotal: ${total.subtotal:.2f}"
         ).pack()
         tk.Label(
             self,
-            text=f"Tax: ${total['tax']:.2f}"
+            text=f"Tax: ${total.tax:.2f}"
         ).pack()
         tk.Label(
             self,
-            text=f"Delivery Fee: ${total['delivery_fee']:.2f}"
+            text=f"Delivery Fee: ${total.delivery_fee:.2f}"
         ).pack()
         tk.Label(
             self,
-            text=f"Total: ${total['total']:.2f}"
+            text=f"Total: ${total.total:.2f}"
         ).pack()
 
         tk.Label(